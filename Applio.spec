@@ -50,7 +50,6 @@ hiddenimports += collect_submodules('groovy')
 hiddenimports += collect_submodules('uvicorn')
 hiddenimports += collect_submodules('transformers')
 hiddenimports += collect_submodules('fairseq')
-hiddenimports += collect_submodules('torch')
 hiddenimports += collect_submodules('torchaudio')
 hiddenimports += collect_submodules('torchvision')
 hiddenimports += collect_submodules('librosa')
@@ -9,7 +9,7 @@ import os
 import pathlib
 import logging
 
-from typing import Any
+from typing import Any, Callable, Optional
 
 DEFAULT_SERVER_NAME = "127.0.0.1"
 DEFAULT_PORT = 6969
@@ -119,7 +119,7 @@ with gr.Blocks(
         download_tab()
 
     with gr.Tab(i18n("Console")):
-        console_tab()
+        console_tab(Applio)
 
     with gr.Tab(i18n("Report a Bug")):
         report_tab()
@@ -137,16 +137,26 @@ with gr.Blocks(
     """)
 
 
-def launch_gradio(server_name: str, server_port: int) -> None:
+def launch_gradio(
+    server_name: str, server_port: int, on_ready: Optional[Callable[[], None]] = None
+) -> None:
+    """
+    Launch the Applio interface and block until the server stops.
+    If on_ready is given (the macOS launcher passes one), it is called as soon as
+    the server is bound, before this function starts blocking.
+    """
     app, _, _ = Applio.launch(
         favicon_path="assets/ICON.ico",
         share="--share" in sys.argv,
         inbrowser="--open" in sys.argv,
         server_name=server_name,
         server_port=server_port,
-        prevent_thread_lock=client_mode,
+        prevent_thread_lock=client_mode or on_ready is not None,
     )
 
+    if on_ready is not None:
+        on_ready()
+
     if client_mode:
         import time
         from rvc.realtime.client import app as fastapi_app
@@ -155,6 +165,8 @@ def launch_gradio(server_name: str, server_port: int) -> None:
 
         while True:
             time.sleep(5)
+    elif on_ready is not None:
+        Applio.block_thread()
 
 
 def get_value_from_args(key: str, default: Any = None) -> Any:
@@ -5,10 +5,15 @@ this directory so they persist across app updates and rebuilds.
 
 - macOS (bundled): ~/Library/Application Support/Applio
 - Otherwise: APPLIO_APP_SUPPORT env var, or current working directory (dev/script)
+
+The launcher sets APPLIO_APP_SUPPORT before any app code is imported, so the
+resolved paths are cached for the lifetime of the process.
 """
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_app_support_dir():
     """
     Return the root directory for user data (models, downloads, logs, etc.).
@@ -18,11 +23,20 @@ def get_app_support_dir():
     return os.environ.get("APPLIO_APP_SUPPORT", os.getcwd())
 
 
+@lru_cache(maxsize=1)
 def get_models_dir():
     """Trained models (RVC .pth, etc.) - e.g. AppSupport/logs."""
     return os.path.join(get_app_support_dir(), "logs")
 
 
+@lru_cache(maxsize=1)
 def get_rvc_models_dir():
     """Pretraineds, embedders, predictors - e.g. AppSupport/rvc/models."""
     return os.path.join(get_app_support_dir(), "rvc", "models")
+
+
+def _reset_cache():
+    """Forget cached paths, e.g. after APPLIO_APP_SUPPORT changes in tests."""
+    get_app_support_dir.cache_clear()
+    get_models_dir.cache_clear()
+    get_rvc_models_dir.cache_clear()
@@ -37,12 +37,12 @@ def generate_fallback_icon(output_path: str, size: int = 256):
         '/Library/Fonts/Arial.ttf',
     ]
     
+    # truetype() raises OSError for a missing font, so no separate exists() check
     for font_path in font_paths:
         try:
-            if Path(font_path).exists():
-                font = ImageFont.truetype(font_path, font_size)
-                break
-        except Exception:
+            font = ImageFont.truetype(font_path, font_size)
+            break
+        except OSError:
             continue
     
     # If no font found, use default
@@ -79,7 +79,8 @@ if __name__ == '__main__':
     else:
         output_path = 'build/macos/temp_icon.png'
     
-    size = 1024 if len(sys.argv) > 2 else 1024  # Use 1024 for better quality
+    # 1024 is the largest iconset entry (icon_512x512@2x), so it is the default
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
     
     try:
         generate_fallback_icon(output_path, size)
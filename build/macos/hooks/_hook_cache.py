@@ -0,0 +1,69 @@
+# Shared cache for the slow parts of the PyInstaller hooks in this directory
+# (not a hook itself - PyInstaller only loads hook-*.py files).
+#
+# collect_submodules/collect_dynamic_libs walk, and in the case of
+# collect_submodules import, the whole package on every build. Results are
+# pickled under ~/Library/Caches/Applio-build, keyed by the installed package
+# (location, version, mtime), the hook file, this file and the PyInstaller
+# version, so reinstalling the package, switching environments, editing a hook
+# or upgrading PyInstaller invalidates the entry. Nothing is imported to build
+# the key.
+# Set APPLIO_BUILD_NO_HOOK_CACHE=1 to bypass it.
+
+import hashlib
+import importlib.metadata
+import importlib.util
+import os
+import pickle
+from pathlib import Path
+
+import PyInstaller
+
+CACHE_DIR = Path.home() / "Library" / "Caches" / "Applio-build"
+
+
+def _dist_versions(package):
+    """Versions of the distributions providing top-level `package`, without importing it."""
+    dists = importlib.metadata.packages_distributions().get(package, [])
+    versions = []
+    for dist in sorted(set(dists)):
+        try:
+            versions.append(f"{dist}=={importlib.metadata.version(dist)}")
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    return ",".join(versions)
+
+
+def cached(package, hook_file, compute):
+    """Return compute()'s result for package, reusing a pickled copy if valid."""
+    if os.environ.get("APPLIO_BUILD_NO_HOOK_CACHE"):
+        return compute()
+
+    # Locate the package without importing it: loading e.g. faiss's libomp next to
+    # torch's in this process aborts on macOS (OMP Error #15)
+    spec = importlib.util.find_spec(package)
+    if spec is None or spec.origin is None:
+        return compute()
+    parts = [
+        spec.origin,
+        str(os.stat(spec.origin).st_mtime_ns),
+        _dist_versions(package),
+        str(os.stat(hook_file).st_mtime_ns),
+        str(os.stat(__file__).st_mtime_ns),
+        PyInstaller.__version__,
+    ]
+    digest = hashlib.sha1(":".join(parts).encode("utf-8")).hexdigest()[:16]
+    cache_file = CACHE_DIR / f"{package}-{digest}.pkl"
+
+    try:
+        return pickle.loads(cache_file.read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    result = compute()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(result))
+    except OSError:
+        pass  # Caching is best effort; the build still has the fresh result
+    return result
@@ -1,10 +1,16 @@
 # PyInstaller hook for faiss-cpu on macOS
 # This ensures faiss libraries are properly included in the bundle
 
+import os
+import sys
 from PyInstaller.utils.hooks import collect_dynamic_libs, collect_data_files
 
-# Collect all dynamic libraries from faiss
-binaries = collect_dynamic_libs('faiss')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _hook_cache import cached
 
-# Collect data files
-datas = collect_data_files('faiss')
+# Collect all dynamic libraries and data files from faiss (cached between builds)
+binaries, datas = cached(
+    'faiss',
+    __file__,
+    lambda: (collect_dynamic_libs('faiss'), collect_data_files('faiss')),
+)
@@ -2,10 +2,38 @@
 # This ensures torch MPS backend and necessary libraries are included
 
 import os
+import sys
 from PyInstaller.utils.hooks import collect_submodules, collect_dynamic_libs
 
-# Collect all torch submodules including MPS backend
-hiddenimports = collect_submodules('torch')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _hook_cache import cached
+
+# Torch subtrees that Applio never imports (test suites, elastic launcher, ONNX
+# exporter opsets). Anything actually imported is still found by analysis.
+_UNUSED_PREFIXES = (
+    'torch.testing._internal',
+    'torch.distributed.elastic',
+    'torch.onnx.symbolic_opset',
+)
+
+
+def _is_used(name):
+    if name.startswith(_UNUSED_PREFIXES):
+        return False
+    return not any(part in ('test', 'tests') for part in name.split('.'))
+
+
+# Collect torch submodules including MPS backend, and its dynamic libraries.
+# collect_submodules imports every submodule, so the result is cached between builds.
+hiddenimports, binaries = cached(
+    'torch',
+    __file__,
+    lambda: (collect_submodules('torch', filter=_is_used), collect_dynamic_libs('torch')),
+)
+# rvc/ is bundled as data, so train.py's own imports (torch.distributed,
+# torch.utils.tensorboard) are invisible to analysis and must stay listed here.
+# torch._dynamo is needed even without torch.compile: optimizers import it lazily,
+# and it reaches into torch._inductor, so both stay.
 hiddenimports += [
     'torch.backends.mps',
     'torch._C',
@@ -15,14 +43,21 @@ hiddenimports += [
     'torch.utils.tensorboard',
 ]
 
-# Collect dynamic libraries
-binaries = collect_dynamic_libs('torch')
+# Never needed at runtime: torch's own test harness and the etcd rendezvous
+# backends of torch.distributed.elastic (Applio trains in a single process).
+excludedimports = [
+    'torch.testing._internal',
+    'torch.distributed.elastic.rendezvous.etcd_rendezvous',
+    'torch.distributed.elastic.rendezvous.etcd_rendezvous_backend',
+    'torch.distributed.elastic.rendezvous.etcd_server',
+    'torch.distributed.elastic.rendezvous.etcd_store',
+]
 
 # torch.__init__ looks for torch/bin/torch_shm_manager at runtime; include it
 _torch_dir = os.path.dirname(__import__('torch').__file__)
 _torch_bin = os.path.join(_torch_dir, 'bin')
 if os.path.isdir(_torch_bin):
-    for name in os.listdir(_torch_bin):
-        path = os.path.join(_torch_bin, name)
-        if os.path.isfile(path):
-            binaries.append((path, 'torch/bin'))
+    with os.scandir(_torch_bin) as entries:
+        for entry in entries:
+            if entry.is_file():
+                binaries.append((entry.path, 'torch/bin'))
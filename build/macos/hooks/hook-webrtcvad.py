@@ -1,10 +1,16 @@
 # PyInstaller hook for webrtcvad on macOS
 # This ensures webrtcvad libraries are properly included in the bundle
 
+import os
+import sys
 from PyInstaller.utils.hooks import collect_dynamic_libs, collect_data_files
 
-# Collect all dynamic libraries from webrtcvad
-binaries = collect_dynamic_libs('webrtcvad')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _hook_cache import cached
 
-# Collect data files if any
-datas = collect_data_files('webrtcvad')
+# Collect all dynamic libraries and data files (if any) from webrtcvad (cached between builds)
+binaries, datas = cached(
+    'webrtcvad',
+    __file__,
+    lambda: (collect_dynamic_libs('webrtcvad'), collect_data_files('webrtcvad')),
+)
@@ -6,61 +6,84 @@ It sets up the environment and launches Applio with pywebview.
 """
 
 import os
+import re
 import sys
 import time
+import queue
 import threading
-from pathlib import Path
 import socket
-import urllib.request
-import urllib.error
+import fcntl
 import atexit
+from datetime import datetime
 
-# Single instance lock port
-SINGLE_INSTANCE_PORT = 58766
+# Host facts used during setup, resolved once (os.uname avoids importing platform)
+_IS_DARWIN = sys.platform == "darwin"
+_MACHINE = os.uname().machine
+
+# Single instance lock file (flock is released by the kernel when the process dies)
+SINGLE_INSTANCE_LOCK = os.path.join(os.path.expanduser("~"), "Library", "Application Support", "Applio", ".lock")
 
 # Global references for cleanup
 _gradio_thread = None
-_lock_socket = None
+_lock_fd = None
 _cleanup_done = False
 
+# Set by the app thread as soon as the Gradio server is bound
+server_ready = threading.Event()
+
+# Console log lines queued by TeeOutput and written by one background thread,
+# so a slow disk never blocks the thread that printed
+_log_queue = queue.SimpleQueue()
+_log_thread = None
+
 def setup_environment():
     """Set up the macOS app environment."""
     # Determine if we're running as a bundled app
     if getattr(sys, 'frozen', False):
         # Running as PyInstaller bundle
         bundle_dir = sys._MEIPASS
-        app_dir = Path(bundle_dir)
+        app_dir = bundle_dir
         print(f"Running as bundled app from: {bundle_dir}")
     else:
         # Running as script
-        app_dir = Path(__file__).parent
+        app_dir = os.path.dirname(os.path.abspath(__file__))
         print(f"Running as script from: {app_dir}")
     
     # Set up paths for the app - ALL data goes to user's Library directory
-    home_dir = Path.home()
-    app_support_dir = home_dir / "Library" / "Application Support" / "Applio"
-    logs_dir = home_dir / "Library" / "Logs" / "Applio"
+    # (plain strings: these are built once and passed straight to os/open calls)
+    home_dir = os.path.expanduser("~")
+    app_support_dir = os.path.join(home_dir, "Library", "Application Support", "Applio")
+    logs_dir = os.path.join(home_dir, "Library", "Logs", "Applio")
     
     # Create directories (user data root so models/data persist across builds/versions)
-    (app_support_dir / "logs").mkdir(parents=True, exist_ok=True)
+    # isdir() first: on warm launches everything exists and mkdir would only hit EEXIST
+    for directory in [os.path.join(app_support_dir, "logs"), logs_dir]:
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
     for directory in [app_support_dir, logs_dir]:
-        directory.mkdir(parents=True, exist_ok=True)
         print(f"Created/verified directory: {directory}")
     
-    os.environ["APPLIO_APP_SUPPORT"] = str(app_support_dir)
-    
     # IMPORTANT: Set environment variables for Apple MPS optimization
     # These settings optimize for Apple's unified memory architecture
-    os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"  # Enable Metal Performance Shaders with CPU fallback
-    os.environ["PYTORCH_MPS_HIGH_WATERMARK_RATIO"] = "0.0"  # Disable MPS memory limit to prevent OOM errors
-    os.environ["OMP_NUM_THREADS"] = "1"  # Optimize for single-threaded performance on Apple Silicon
-    os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"  # Allow duplicate library loading
+    env = {
+        "APPLIO_APP_SUPPORT": app_support_dir,
+        "PYTORCH_ENABLE_MPS_FALLBACK": "1",  # Enable Metal Performance Shaders with CPU fallback
+        "PYTORCH_MPS_HIGH_WATERMARK_RATIO": "0.0",  # Disable MPS memory limit to prevent OOM errors
+        "KMP_DUPLICATE_LIB_OK": "TRUE",  # Allow duplicate library loading
+    }
+    
+    # Let torch/faiss/numpy use the performance cores, leaving two for the UI and
+    # the Gradio event loop. A value set by the user is kept.
+    if "OMP_NUM_THREADS" not in os.environ:
+        env["OMP_NUM_THREADS"] = str(max(1, (os.cpu_count() or 1) - 2))
     
     # Additional MPS optimizations for Apple Silicon
-    if sys.platform == "darwin":
+    if _IS_DARWIN:
         # Note: These are experimental optimizations for Metal GPU performance
         # METAL_DEVICE_WRAPPER_TYPE enables Metal device wrapper for better compatibility
-        os.environ["METAL_DEVICE_WRAPPER_TYPE"] = "1"
+        env["METAL_DEVICE_WRAPPER_TYPE"] = "1"
+    
+    os.environ.update(env)
     
     # Change working directory to app bundle
     os.chdir(app_dir)
@@ -72,32 +95,40 @@ def setup_environment():
     print(f"  Working Dir: {app_dir}")
     
     # Log system information
-    import platform
     print(f"\nSystem Information:")
     print(f"  Platform: {sys.platform}")
-    print(f"  Machine: {platform.machine()}")
+    print(f"  Machine: {_MACHINE}")
     print(f"  Python: {sys.version.split()[0]}")
     
     # Check for Apple Silicon
-    if sys.platform == "darwin" and platform.machine() == "arm64":
+    if _IS_DARWIN and _MACHINE == "arm64":
         print(f"  Apple Silicon: Detected (MPS optimizations enabled)")
     
     return app_dir, logs_dir
 
 def check_single_instance():
-    """Check if another instance of the app is already running."""
-    # Try to bind to a port to ensure single instance
+    """
+    Check if another instance of the app is already running.
+    Returns the lock file descriptor, or None if another instance holds the lock.
+    Any other OSError (e.g. the lock file cannot be created) is raised to the caller.
+    """
+    # Take an exclusive, non-blocking lock on a file to ensure single instance
+    os.makedirs(os.path.dirname(SINGLE_INSTANCE_LOCK), exist_ok=True)
+    fd = os.open(SINGLE_INSTANCE_LOCK, os.O_RDWR | os.O_CREAT, 0o644)
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.bind(('127.0.0.1', SINGLE_INSTANCE_PORT))
-        return sock  # Keep socket open to maintain lock
-    except OSError:
-        # Port is already in use - another instance is running
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        # Lock is held - another instance is running
+        os.close(fd)
         return None
+    except OSError:
+        os.close(fd)
+        raise
+    return fd  # Keep descriptor open to maintain lock
 
 def cleanup():
     """Cleanup resources on shutdown. Idempotent - safe to call multiple times."""
-    global _lock_socket, _cleanup_done
+    global _lock_fd, _cleanup_done
     
     # Prevent multiple cleanup calls
     if _cleanup_done:
@@ -106,10 +137,10 @@ def cleanup():
     
     print("\nCleaning up resources...")
     
-    # Close the lock socket
-    if _lock_socket:
+    # Release the instance lock
+    if _lock_fd is not None:
         try:
-            _lock_socket.close()
+            os.close(_lock_fd)
             print("✓ Released instance lock")
         except (OSError, Exception):
             pass
@@ -117,17 +148,80 @@ def cleanup():
     # Note: Gradio thread is daemon and will be terminated automatically
     print("✓ Server shutdown initiated")
     print("Goodbye!")
+    
+    # Flush queued log lines before the process exits (we may be followed by os._exit)
+    _stop_log_writer()
+
+def _log_worker(log_file):
+    """Write queued (timestamp, message) pairs to the console log until None arrives."""
+    while True:
+        item = _log_queue.get()
+        if item is None:
+            break
+        timestamp, message = item
+        try:
+            timestamp = timestamp.strftime('%Y-%m-%d %H:%M:%S')
+            if message.endswith('\n'):
+                log_file.write(f"[{timestamp}] {message}")
+            else:
+                log_file.write(f"[{timestamp}] {message}\n")
+        except Exception as e:
+            try:
+                sys.__stderr__.write(f"[Logging Error: {e}]\n")
+            except Exception:
+                pass
+    log_file.close()
 
-def wait_for_server(url='http://127.0.0.1:6969', timeout=30):
-    """Wait for the server to be ready by polling. Returns True when ready."""
+def _start_log_writer(file_path):
+    """Open the console log (line-buffered) and start the writer thread."""
+    global _log_thread
+    log_file = open(file_path, 'a', encoding='utf-8', buffering=1)
+    _log_thread = threading.Thread(target=_log_worker, args=(log_file,), daemon=True)
+    _log_thread.start()
+    atexit.register(_stop_log_writer)
+
+def _stop_log_writer():
+    """Drain the log queue and stop the writer thread. Safe to call more than once."""
+    global _log_thread
+    thread, _log_thread = _log_thread, None
+    if thread is not None:
+        _log_queue.put(None)
+        thread.join(timeout=2)
+
+def wait_for_server(host='127.0.0.1', port=6969, timeout=30, verify_http=False):
+    """
+    Wait for the server to be ready by probing its TCP port. Returns True when ready.
+    A successful connect means Gradio has bound the socket; pass verify_http=True
+    to additionally require a 200 response from GET / (useful for debugging).
+    """
     start_time = time.time()
     while time.time() - start_time < timeout:
         try:
-            response = urllib.request.urlopen(url, timeout=1)
-            if response.getcode() == 200:
-                return True
-        except (urllib.error.URLError, ConnectionError, OSError):
-            time.sleep(0.5)
+            with socket.create_connection((host, port), timeout=0.25) as sock:
+                if not verify_http:
+                    return True
+                # Minimal raw request; avoids urllib's opener and proxy lookup
+                sock.settimeout(1)
+                sock.sendall(f"GET / HTTP/1.0\r\nHost: {host}\r\n\r\n".encode("ascii"))
+                if sock.recv(16).startswith((b"HTTP/1.0 200", b"HTTP/1.1 200")):
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.1)
+    return False
+
+def wait_for_ready(timeout=600, poll_interval=1.0):
+    """
+    Wait for the app to set server_ready. Returns True when ready.
+    The port is probed every poll_interval seconds as a fallback in case the
+    app never signals (e.g. it was started without the on_ready hook).
+    """
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server_ready.wait(timeout=poll_interval):
+            return True
+        if wait_for_server(timeout=0.25):
+            return True
     return False
 
 # Shown immediately so user sees progress; we redirect to the real UI when server is up (no second instance).
@@ -158,24 +252,37 @@ LOADING_HTML = '''<!DOCTYPE html>
   </div>
 </body>
 </html>'''
+# Collapse whitespace once at import; the page is parsed on the cold-start path.
+LOADING_HTML = re.sub(r'\s+', ' ', LOADING_HTML).strip()
+
+def _fallback_browser_mode():
+    """Open the UI in the default browser and block until Ctrl+C."""
+    import signal
+    import webbrowser
+    webbrowser.open("http://127.0.0.1:6969")
+    # Keep the server running - wait for user to terminate. Event.wait() blocks
+    # without periodic wakeups, so macOS App Nap can fully suspend the process.
+    print("Server is running. Press Ctrl+C to stop.")
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+    stop.wait()
+    print("\nStopping server...")
 
 def launch_gradio(app_dir, logs_dir):
     """Launch the Gradio app."""
     global _gradio_thread
     
     # Import and run the Gradio app
-    sys.path.insert(0, str(app_dir))
+    sys.path.insert(0, app_dir)
     
     # Set up log file to capture all output
-    log_file_path = logs_dir / "console.log"
+    log_file_path = os.path.join(logs_dir, "console.log")
     
     # Custom output wrapper that writes to both stdout and log file
     class TeeOutput:
         """A class that writes to both stdout/stderr and a log file."""
-        def __init__(self, file_path, original_stream):
-            self.file_path = file_path
+        def __init__(self, original_stream):
             self.original_stream = original_stream
-            self.log_file = None
             
         def write(self, message):
             # Write to original stream (stdout/stderr)
@@ -186,21 +293,9 @@ def launch_gradio(app_dir, logs_dir):
                 except Exception:
                     pass
             
-            # Write to log file
-            if message.strip():  # Only write non-empty messages
-                try:
-                    # Open in append mode, write, and close immediately for real-time updates
-                    with open(self.file_path, 'a', encoding='utf-8') as f:
-                        from datetime import datetime
-                        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        f.write(f"[{timestamp}] {message}")
-                        if not message.endswith('\n'):
-                            f.write('\n')
-                        f.flush()
-                except Exception as e:
-                    # Fallback to original stream if logging fails
-                    if self.original_stream:
-                        self.original_stream.write(f"[Logging Error: {e}]\n")
+            # Hand non-empty messages to the log writer thread
+            if _log_thread is not None and message.strip():
+                _log_queue.put_nowait((datetime.now(), message))
         
         def flush(self):
             if self.original_stream:
@@ -213,9 +308,16 @@ def launch_gradio(app_dir, logs_dir):
             """Required by uvicorn/logging when configuring formatters; we are not a TTY."""
             return False
     
-    # Redirect stdout and stderr to our tee
-    sys.stdout = TeeOutput(log_file_path, sys.stdout)
-    sys.stderr = TeeOutput(log_file_path, sys.stderr)
+    # Start the log writer, then redirect stdout and stderr to our tee
+    try:
+        _start_log_writer(log_file_path)
+    except OSError as e:
+        print(f"[Logging Error: {e}]")
+    sys.stdout = TeeOutput(sys.stdout)
+    sys.stderr = TeeOutput(sys.stderr)
+    
+    # Registered after the log writer so cleanup's messages still reach the log
+    atexit.register(cleanup)
     
     print(f"Starting Applio...")
     print(f"Logs directory: {logs_dir}")
@@ -228,12 +330,22 @@ def launch_gradio(app_dir, logs_dir):
     def run_app_and_server():
         try:
             import app
-            app.launch_gradio("127.0.0.1", 6969)
+            app.launch_gradio("127.0.0.1", 6969, on_ready=server_ready.set)
         except Exception as e:
             print(f"ERROR: Failed to start Applio: {e}")
             import traceback
             traceback.print_exc()
     
+    # Warm up torch while the app thread imports gradio and the window is created;
+    # the import lock makes app's own `import torch` reuse the loaded module.
+    def preimport_torch():
+        try:
+            import torch  # noqa: F401
+        except Exception:
+            pass  # The app thread reports import errors itself
+    
+    threading.Thread(target=preimport_torch, daemon=True).start()
+    
     _gradio_thread = threading.Thread(target=run_app_and_server, daemon=True)
     _gradio_thread.start()
     
@@ -258,7 +370,7 @@ def launch_gradio(app_dir, logs_dir):
         # Redirect this same window when server is up (long timeout for first-run download).
         def redirect_when_ready():
             print("Waiting for Applio server (prerequisites may be downloading)...")
-            if wait_for_server(timeout=600):
+            if wait_for_ready(timeout=600):
                 print("Applio server is ready — switching to main interface.")
                 try:
                     window.load_url("http://127.0.0.1:6969")
@@ -280,42 +392,25 @@ def launch_gradio(app_dir, logs_dir):
             except Exception:
                 pass
         
-        atexit.register(cleanup)
         webview.start(gui='cocoa')
         print("\nWindow closed by user")
         
     except ImportError:
         print("Warning: pywebview not available, falling back to browser")
-        import webbrowser
-        webbrowser.open("http://127.0.0.1:6969")
-        # Keep the server running - wait for user to terminate
-        print("Server is running. Press Ctrl+C to stop.")
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\nStopping server...")
+        _fallback_browser_mode()
     except Exception as e:
         print(f"Error launching window: {e}")
         print("Falling back to browser...")
-        import webbrowser
-        webbrowser.open("http://127.0.0.1:6969")
-        # Keep the server running - wait for user to terminate
-        print("Server is running. Press Ctrl+C to stop.")
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\nStopping server...")
+        _fallback_browser_mode()
 
 def main():
     """Main entry point."""
-    global _lock_socket
+    global _lock_fd
     
     try:
         # Check if another instance is already running
-        _lock_socket = check_single_instance()
-        if _lock_socket is None:
+        _lock_fd = check_single_instance()
+        if _lock_fd is None:
             print("Another instance of Applio is already running.")
             print("Only one instance can be opened at a time.")
             sys.exit(0)
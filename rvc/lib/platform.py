@@ -5,5 +5,6 @@ import platform
 
 def platform_config():
     if sys.platform == "darwin" and platform.machine() == "arm64":
-        os.environ["OMP_NUM_THREADS"] = "1"
+        # setdefault: keep a thread count chosen by the macOS launcher or the user
+        os.environ.setdefault("OMP_NUM_THREADS", "1")
         os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
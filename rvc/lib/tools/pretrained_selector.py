@@ -1,14 +1,30 @@
 import os
-from app_paths import get_app_support_dir
+from app_paths import get_rvc_models_dir
+
+# Only successful lookups are cached, so pretraineds downloaded later in the
+# session (e.g. retried from the Train tab) are still picked up.
+_selected = {}
 
 
 def pretrained_selector(vocoder, sample_rate):
-    base_path = os.path.join(get_app_support_dir(), "rvc", "models", "pretraineds", f"{vocoder.lower()}")
+    key = (vocoder, sample_rate)
+    if key in _selected:
+        return _selected[key]
+
+    base_path = os.path.join(get_rvc_models_dir(), "pretraineds", f"{vocoder.lower()}")
 
-    path_g = os.path.join(base_path, f"f0G{str(sample_rate)[:2]}k.pth")
-    path_d = os.path.join(base_path, f"f0D{str(sample_rate)[:2]}k.pth")
+    name_g = f"f0G{str(sample_rate)[:2]}k.pth"
+    name_d = f"f0D{str(sample_rate)[:2]}k.pth"
+
+    # One directory read instead of a stat per file
+    try:
+        with os.scandir(base_path) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return "", ""
 
-    if os.path.exists(path_g) and os.path.exists(path_d):
-        return path_g, path_d
+    if name_g in names and name_d in names:
+        _selected[key] = (os.path.join(base_path, name_g), os.path.join(base_path, name_d))
+        return _selected[key]
     else:
         return "", ""
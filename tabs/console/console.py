@@ -1,6 +1,10 @@
 import os
 import sys
+import zlib
+import threading
+import collections
 import gradio as gr
+from functools import lru_cache
 from pathlib import Path
 
 from assets.i18n.i18n import I18nAuto
@@ -10,8 +14,78 @@ sys.path.append(now_dir)
 
 i18n = I18nAuto()
 
+# Incremental tail of the log shared by all refreshes: the file (inode) and byte
+# offset read up to, the last complete lines (slider max is 1000) and any
+# trailing partial line
+_MAX_TAIL_LINES = 1000
+_tail_state = {
+    "inode": None,
+    "offset": 0,
+    "lines": collections.deque(maxlen=_MAX_TAIL_LINES),
+    "partial": b"",
+}
+_tail_lock = threading.Lock()
+
+# Static Markdown for the tab, translated once at import instead of per build
+_HEADER_MD = i18n(
+    "## Console Output\n"
+    "View real-time console output from Applio. This shows all Python output including model loading, training progress, and errors."
+)
+_ABOUT_MD = i18n(
+    "### About the Console\n\n"
+    "The console displays all output from Applio, including:\n"
+    "- **Model Loading**: Progress of model initialization\n"
+    "- **Training**: Epoch progress, loss values, and training metrics\n"
+    "- **Inference**: Processing status and completion messages\n"
+    "- **Errors**: Detailed error messages and stack traces\n"
+    "- **System Info**: GPU/CPU usage, memory statistics\n\n"
+    "**Log Location**:\n"
+    f"- Bundled App: `~/Library/Logs/Applio/console.log`\n"
+    f"- Script Mode: `{os.path.join(now_dir, 'logs', 'console.log')}`\n\n"
+    "**Tips**:\n"
+    "- Use auto-refresh to monitor long-running tasks\n"
+    "- Increase line count to see more history\n"
+    "- Copy output to share error messages\n"
+    "- Clear log to reset and reduce file size"
+)
+
+# Auto-refresh polling: starts at 2 s and doubles (up to 30 s) after every few
+# ticks without new output; any change snaps it back. Tracked per session.
+_BASE_REFRESH_INTERVAL = 2
+_MAX_REFRESH_INTERVAL = 30
+_IDLE_TICKS_BEFORE_BACKOFF = 3
+
+def _new_refresh_state():
+    """Fresh per-session auto-refresh state (see console_tab)."""
+    return {
+        "stat": None,
+        "digest": None,
+        "idle_ticks": 0,
+        "interval": _BASE_REFRESH_INTERVAL,
+    }
+
+def _next_refresh_interval(state, changed):
+    """Count this session's idle ticks and return an update for its timer if the interval should change."""
+    if changed:
+        state["idle_ticks"] = 0
+        interval = _BASE_REFRESH_INTERVAL
+    else:
+        state["idle_ticks"] += 1
+        interval = state["interval"]
+        if state["idle_ticks"] >= _IDLE_TICKS_BEFORE_BACKOFF:
+            state["idle_ticks"] = 0
+            interval = min(state["interval"] * 2, _MAX_REFRESH_INTERVAL)
+    if interval == state["interval"]:
+        return gr.update()
+    state["interval"] = interval
+    return gr.update(value=interval)
+
+@lru_cache(maxsize=1)
 def get_console_log_path():
-    """Get the console log file path. Works for both bundled and script mode."""
+    """
+    Get the console log file path. Works for both bundled and script mode.
+    Resolved (and the file created) once; the path is fixed for the process lifetime.
+    """
     if getattr(sys, 'frozen', False):
         # Running as bundled app - logs are in ~/Library/Logs/Applio/
         home_dir = Path.home()
@@ -29,22 +103,80 @@ def get_console_log_path():
     
     return str(log_path)
 
+def _read_tail(f, end, lines, block_size=8192):
+    """Return the last `lines` lines of binary file `f` up to byte `end`, reading backwards."""
+    pos = end
+    chunks = []
+    newlines = 0
+    # Read block by block from the end until the buffer holds enough line breaks
+    while pos > 0 and newlines <= lines:
+        step = min(block_size, pos)
+        pos -= step
+        f.seek(pos)
+        chunk = f.read(step)
+        newlines += chunk.count(b'\n')
+        chunks.append(chunk)
+    buf = b''.join(reversed(chunks))
+
+    # Walk back `lines` line breaks (ignoring a trailing one) to find where the tail starts
+    idx = len(buf) - 1 if buf.endswith(b'\n') else len(buf)
+    for _ in range(lines):
+        idx = buf.rfind(b'\n', 0, idx)
+        if idx == -1:
+            break
+    return buf[idx + 1:]
+
+def _reset_tail():
+    _tail_state["inode"] = None
+    _tail_state["offset"] = 0
+    _tail_state["lines"].clear()
+    _tail_state["partial"] = b""
+
+def _update_tail(f):
+    """Bring _tail_state up to date with `f`, reading only what was appended since last time."""
+    state = _tail_state
+    # One fstat gives both the identity and the size of the open file
+    st = os.fstat(f.fileno())
+    inode, end = st.st_ino, st.st_size
+    if inode != state["inode"] or end < state["offset"]:
+        # First read, or the log was rotated/truncated: start over from the tail
+        _reset_tail()
+        state["inode"] = inode
+
+    if state["offset"] == 0:
+        data = _read_tail(f, end, _MAX_TAIL_LINES)
+    else:
+        f.seek(state["offset"])
+        data = state["partial"] + f.read(end - state["offset"])
+    state["offset"] = end
+
+    parts = data.split(b'\n')
+    state["partial"] = parts.pop()
+    state["lines"].extend(part + b'\n' for part in parts)
+
+def _read_console_tail(lines):
+    """Return the last N lines of the console log as bytes."""
+    with _tail_lock, open(get_console_log_path(), 'rb') as f:
+        # Only newly appended bytes are read, so cost does not grow with log size
+        _update_tail(f)
+        
+        partial = _tail_state["partial"]
+        count = min(lines, _MAX_TAIL_LINES) - (1 if partial else 0)
+        # A bounded deque keeps just the last `count` lines without copying all of them
+        recent = collections.deque(_tail_state["lines"], maxlen=count) if count > 0 else ()
+        return b''.join(recent) + partial
+
+def _format_console_tail(tail):
+    if not tail:
+        return "Console log is empty. Waiting for output..."
+    return tail.decode('utf-8', errors='ignore')
+
 def read_console_log(lines=100):
     """Read the last N lines from the console log."""
     try:
-        log_path = get_console_log_path()
-        if not os.path.exists(log_path):
-            return "Console log file not found. The app may not have started logging yet."
-        
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            # Read all lines and get the last N
-            all_lines = f.readlines()
-            last_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-            
-            if not last_lines:
-                return "Console log is empty. Waiting for output..."
-            
-            return ''.join(last_lines)
+        return _format_console_tail(_read_console_tail(lines))
+    except FileNotFoundError:
+        return "Console log file not found. The app may not have started logging yet."
     except Exception as e:
         return f"Error reading console log: {str(e)}"
 
@@ -52,20 +184,17 @@ def clear_console_log():
     """Clear the console log file."""
     try:
         log_path = get_console_log_path()
-        with open(log_path, 'w', encoding='utf-8') as f:
-            f.write("")
+        with _tail_lock:
+            os.truncate(log_path, 0)
+            _reset_tail()
         return "Console log cleared successfully."
     except Exception as e:
         return f"Error clearing console log: {str(e)}"
 
-def console_tab():
+def console_tab(blocks):
+    """Build the Console tab; blocks is the root gr.Blocks, used for the page-load event."""
     with gr.Column():
-        gr.Markdown(
-            i18n(
-                "## Console Output\n"
-                "View real-time console output from Applio. This shows all Python output including model loading, training progress, and errors."
-            )
-        )
+        gr.Markdown(_HEADER_MD)
         
         with gr.Row():
             lines_slider = gr.Slider(
@@ -81,7 +210,7 @@ def console_tab():
             refresh_btn = gr.Button(i18n("🔄 Refresh"), variant="primary")
             clear_btn = gr.Button(i18n("🗑️ Clear Log"), variant="secondary")
             auto_refresh = gr.Checkbox(
-                label=i18n("Auto-refresh (every 2 seconds)"),
+                label=i18n("Auto-refresh (every 2 s, slower when idle)"),
                 value=False
             )
         
@@ -89,36 +218,25 @@ def console_tab():
             label=i18n("Console Log"),
             lines=25,
             max_lines=50,
-            value=read_console_log(200),
+            # Filled by the page-load event below, not while the UI is being built
+            value="",
             interactive=False,
             elem_classes=["console-output"]
         )
         
         with gr.Accordion(i18n("ℹ️ Console Information"), open=False):
-            gr.Markdown(
-                i18n(
-                    "### About the Console\n\n"
-                    "The console displays all output from Applio, including:\n"
-                    "- **Model Loading**: Progress of model initialization\n"
-                    "- **Training**: Epoch progress, loss values, and training metrics\n"
-                    "- **Inference**: Processing status and completion messages\n"
-                    "- **Errors**: Detailed error messages and stack traces\n"
-                    "- **System Info**: GPU/CPU usage, memory statistics\n\n"
-                    "**Log Location**:\n"
-                    f"- Bundled App: `~/Library/Logs/Applio/console.log`\n"
-                    f"- Script Mode: `{os.path.join(now_dir, 'logs', 'console.log')}`\n\n"
-                    "**Tips**:\n"
-                    "- Use auto-refresh to monitor long-running tasks\n"
-                    "- Increase line count to see more history\n"
-                    "- Copy output to share error messages\n"
-                    "- Clear log to reset and reduce file size"
-                )
-            )
+            gr.Markdown(_ABOUT_MD)
         
         # Event handlers
         def refresh_console(lines):
             return read_console_log(int(lines))
         
+        # Each page opens with the current tail
+        blocks.load(
+            fn=lambda: read_console_log(200),
+            outputs=[console_output]
+        )
+        
         def handle_clear():
             clear_console_log()
             gr.Info(i18n("Console log cleared successfully."))
@@ -135,15 +253,59 @@ def console_tab():
             outputs=[console_output]
         )
         
-        # Auto-refresh: use gr.Timer (documented) to poll every 2s when enabled
-        def auto_refresh_func(enabled, lines):
+        # Auto-refresh: use gr.Timer (documented) to poll every 2s when enabled,
+        # backing off while the log is idle
+        def poll_console(lines, state):
+            """Return (output, changed) for one auto-refresh tick, updating this session's state."""
+            # Skip the read and the resend when the log has not changed since this
+            # session's last tick
+            try:
+                st = os.stat(get_console_log_path())
+                current = (st.st_mtime_ns, st.st_size, int(lines))
+            except OSError:
+                current = None
+            if current is not None and current == state["stat"]:
+                return gr.update(), False
+            state["stat"] = current
+            
+            # The file changed, but the visible tail may not have; don't resend it then
+            try:
+                tail = _read_console_tail(int(lines))
+            except Exception:
+                return refresh_console(lines), True  # Shows the error message
+            digest = (int(lines), zlib.crc32(tail))
+            if digest == state["digest"]:
+                return gr.update(), False
+            state["digest"] = digest
+            return _format_console_tail(tail), True
+        
+        def auto_refresh_func(enabled, lines, state):
             if enabled:
-                return refresh_console(lines)
-            return gr.update()
+                state = dict(state)
+                output, changed = poll_console(lines, state)
+                return output, _next_refresh_interval(state, changed), state
+            return gr.update(), gr.update(), state
         
-        timer = gr.Timer(value=2)
+        def toggle_auto_refresh(enabled):
+            # Start polling at the base rate with fresh state; stop the timer
+            # entirely when disabled
+            return gr.Timer(value=_BASE_REFRESH_INTERVAL, active=enabled), _new_refresh_state()
+        
+        # Per-session auto-refresh bookkeeping: each client (app window, browser
+        # tab, share link) decides on its own whether its textbox is current.
+        # stat: (mtime_ns, size, lines) of the log at this session's last update
+        # digest: (lines, crc32) of the tail last sent to this session
+        # idle_ticks, interval: backoff of this session's timer
+        refresh_state = gr.State(_new_refresh_state())
+        
+        timer = gr.Timer(value=_BASE_REFRESH_INTERVAL, active=False)
         timer.tick(
             fn=auto_refresh_func,
-            inputs=[auto_refresh, lines_slider],
-            outputs=[console_output]
+            inputs=[auto_refresh, lines_slider, refresh_state],
+            outputs=[console_output, timer, refresh_state]
+        )
+        auto_refresh.change(
+            fn=toggle_auto_refresh,
+            inputs=[auto_refresh],
+            outputs=[timer, refresh_state]
         )
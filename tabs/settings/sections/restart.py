@@ -2,6 +2,7 @@ import gradio as gr
 import os
 import sys
 import json
+import contextlib
 
 from app_paths import get_app_support_dir
 
@@ -11,14 +12,16 @@ now_dir = os.getcwd()
 def stop_train(model_name: str):
     pid_file_path = os.path.join(get_app_support_dir(), "logs", model_name, "config.json")
     try:
-        with open(pid_file_path, "r") as pid_file:
+        with open(pid_file_path, "r+") as pid_file:
             pid_data = json.load(pid_file)
-            pids = pid_data.get("process_pids", [])
-        with open(pid_file_path, "w") as pid_file:
-            pid_data.pop("process_pids", None)
+            pids = pid_data.pop("process_pids", [])
+            pid_file.seek(0)
+            pid_file.truncate()
             json.dump(pid_data, pid_file, indent=4)
         for pid in pids:
-            os.kill(pid, 9)
+            # One already-exited process must not stop the rest from being killed
+            with contextlib.suppress(ProcessLookupError, PermissionError):
+                os.kill(pid, 9)
     except:
         pass
 
@@ -43,10 +46,6 @@ def restart_applio():
             "When running as the Applio app, please quit (Cmd+Q or close the window) and reopen Applio to restart. "
             "Do not use Restart from within the app."
         )
-    if os.name != "nt":
-        os.system("clear")
-    else:
-        os.system("cls")
     python = sys.executable
     os.execl(python, python, *sys.argv)
 